@@ -26,7 +26,7 @@ def main():
     app.setApplicationVersion("1.0.0")
     
     # Load settings
-    settings = AppSettings()
+    settings = AppSettings.from_env()
     
     # Create and show main window
     main_window = MainWindow(settings)
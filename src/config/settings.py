@@ -4,27 +4,48 @@ Application settings and configuration
 
 import os
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
-@dataclass
+# Theme names understood by the GUI; anything else falls back to the first
+THEMES = ("light", "dark")
+
+@lru_cache(maxsize=None)
+def _env(name: str, default: str) -> str:
+    """Read an environment variable once per process"""
+    return os.getenv(name, default)
+
+@lru_cache(maxsize=None)
+def _ensure_tmpdir(path: Path) -> Path:
+    """Create the temp directory once per process"""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class AppSettings:
     """Application settings container"""
     debug: bool = False
     theme: str = "light"
     language: str = "en"
     temp_dir: Path = Path("/tmp/wpdadjuster")
+    is_dark_theme: bool = field(init=False)
     
     def __post_init__(self):
+        """Normalize the theme name and derive cached flags"""
+        if self.theme not in THEMES:
+            object.__setattr__(self, "theme", THEMES[0])
+        object.__setattr__(self, "is_dark_theme", self.theme == "dark")
+    
+    @classmethod
+    def from_env(cls) -> "AppSettings":
         """Initialize settings from environment variables"""
-        self.debug = os.getenv("APP_DEBUG", "false").lower() == "true"
-        self.theme = os.getenv("APP_THEME", "light")
-        self.language = os.getenv("APP_LANG", "en")
+        settings = cls(
+            debug=_env("APP_DEBUG", "false").lower() == "true",
+            theme=_env("APP_THEME", "light"),
+            language=_env("APP_LANG", "en")
+        )
         
         # Ensure temp directory exists
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
-    
-    @property
-    def is_dark_theme(self) -> bool:
-        """Check if dark theme is enabled"""
-        return self.theme == "dark"
+        _ensure_tmpdir(settings.temp_dir)
+        return settings
@@ -2,13 +2,28 @@
 Document overview widget showing document properties
 """
 
+import heapq
 import logging
+from operator import itemgetter
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QGroupBox, QScrollArea, QFrame
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QGroupBox, QScrollArea, QFrame, QFormLayout
 )
 from PyQt6.QtCore import Qt
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+
+# Plain-text templates for the overview rows, formatted on each update
+_SIZE_FMT = "{:.1f}″ × {:.1f}″"
+_INCHES_FMT = "{:.1f}″"
+_COUNT_FMT = "{:,}"
+_FONT_KEY_FMT = "{}:"
+_FONT_COUNT_FMT = "{} occurrences"
+_HEADING_FMT = "  • {}: {}"
+
+_MARGIN_SIDES = ('top', 'bottom', 'left', 'right')
+
+# Maximum number of font rows shown in the overview
+_MAX_FONT_ROWS = 50
 
 class DocumentOverview(QWidget):
     """Widget displaying document overview and properties"""
@@ -16,8 +31,10 @@ class DocumentOverview(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
+        self._font_row_pool: List[Tuple[QLabel, QLabel]] = []
+        self._heading_label_pool: List[QLabel] = []
         self.setup_ui()
-        
+    
     def setup_ui(self):
         """Setup the document overview UI"""
         layout = QVBoxLayout(self)
@@ -28,6 +45,11 @@ class DocumentOverview(QWidget):
         scroll_area.setWidgetResizable(True)
         scroll_area.setFrameStyle(QFrame.Shape.NoFrame)
         
+        # Let the viewport blit its cached contents when scrolling
+        viewport = scroll_area.viewport()
+        viewport.setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
+        viewport.setAutoFillBackground(True)
+        
         # Content widget
         self.content_widget = QWidget()
         self.content_layout = QVBoxLayout(self.content_widget)
@@ -35,159 +57,226 @@ class DocumentOverview(QWidget):
         scroll_area.setWidget(self.content_widget)
         layout.addWidget(scroll_area)
         
+        # Placeholder shown when no document is loaded
+        self.placeholder_label = QLabel("No document loaded")
+        self.placeholder_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.placeholder_label.setStyleSheet("color: #757575; font-style: italic;")
+        self.content_layout.addWidget(self.placeholder_label)
+        
+        # Sections are built once and updated in place
+        self.setup_document_info()
+        self.setup_page_settings()
+        self.setup_font_info()
+        self.setup_content_stats()
+        
         # Initially show placeholder
         self.show_placeholder()
+    
+    def _make_label(self, object_name: str, text: str = "") -> QLabel:
+        """Create a plain-text label styled through its object name"""
+        label = QLabel(text)
+        label.setTextFormat(Qt.TextFormat.PlainText)
+        label.setObjectName(object_name)
+        return label
+    
+    def _add_value_label(self, layout: QVBoxLayout, object_name: str = "documentValue") -> QLabel:
+        """Create a value label and add it to the given layout"""
+        label = self._make_label(object_name)
+        layout.addWidget(label)
+        return label
+    
+    def _add_key_value_row(self, layout: QFormLayout, key: str = "") -> Tuple[QLabel, QLabel]:
+        """Add a bold key / value row to a form layout"""
+        key_label = self._make_label("documentKey", key)
+        value_label = self._make_label("documentValue")
+        layout.addRow(key_label, value_label)
+        return key_label, value_label
+    
+    def _add_form_row(self, layout: QFormLayout, key: str) -> QLabel:
+        """Add a bold key / value row to a form layout and return the value label"""
+        return self._add_key_value_row(layout, key)[1]
+    
+    def setup_document_info(self):
+        """Build document information section"""
+        self.info_group = QGroupBox("📄 Document Information")
+        layout = QFormLayout(self.info_group)
+        layout.setSpacing(8)
         
-    def show_placeholder(self):
-        """Show placeholder when no document is loaded"""
-        # Clear existing content
-        self.clear_content()
-        
-        placeholder = QLabel("No document loaded")
-        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        placeholder.setStyleSheet("color: #757575; font-style: italic;")
-        self.content_layout.addWidget(placeholder)
-        
-    def clear_content(self):
-        """Clear all content from the layout"""
-        while self.content_layout.count():
-            child = self.content_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-                
-    def update_document(self, document_data: Dict[str, Any]):
-        """Update the overview with document data"""
-        self.clear_content()
+        self.title_label = self._add_form_row(layout, "Title:")
+        self.author_label = self._add_form_row(layout, "Author:")
+        self.file_type_label = self._add_form_row(layout, "Type:")
+        self.filename_label = self._add_form_row(layout, "File:")
         
-        # Document info section
-        self.add_document_info(document_data)
+        self.content_layout.addWidget(self.info_group)
+    
+    def setup_page_settings(self):
+        """Build page settings section"""
+        self.page_group = QGroupBox("📏 Page Settings")
+        layout = QFormLayout(self.page_group)
+        layout.setSpacing(8)
         
-        # Page settings section
-        self.add_page_settings(document_data)
+        self.dim_label = self._add_form_row(layout, "Size:")
         
-        # Font information section
-        self.add_font_info(document_data)
+        layout.addRow(self._make_label("documentKey", "Margins:"))
         
-        # Content statistics section
-        self.add_content_stats(document_data)
+        self.margin_top_label = self._add_form_row(layout, "• Top:")
+        self.margin_bottom_label = self._add_form_row(layout, "• Bottom:")
+        self.margin_left_label = self._add_form_row(layout, "• Left:")
+        self.margin_right_label = self._add_form_row(layout, "• Right:")
         
-    def add_document_info(self, data: Dict[str, Any]):
-        """Add document information section"""
-        group = QGroupBox("📄 Document Information")
-        layout = QVBoxLayout(group)
-        layout.setSpacing(8)
+        layout.addRow(self._make_label("measurementUnit", "(all measurements in inches)"))
         
-        # Title
-        title_label = QLabel(f"<b>Title:</b> {data.get('title', 'Untitled')}")
-        title_label.setObjectName("documentValue")
-        layout.addWidget(title_label)
+        self.content_layout.addWidget(self.page_group)
+    
+    def setup_font_info(self):
+        """Build font information section"""
+        self.font_group = QGroupBox("🔤 Fonts Used")
+        self.font_layout = QFormLayout(self.font_group)
+        self.font_layout.setSpacing(6)
         
-        # Author
-        author_label = QLabel(f"<b>Author:</b> {data.get('author', 'Unknown')}")
-        author_label.setObjectName("documentValue")
-        layout.addWidget(author_label)
+        self.no_fonts_label = self._make_label("measurementUnit", "No font information available")
+        self.font_layout.addRow(self.no_fonts_label)
         
-        # File type
-        file_type_label = QLabel(f"<b>Type:</b> {data.get('file_type', 'Unknown').upper()}")
-        file_type_label.setObjectName("documentValue")
-        layout.addWidget(file_type_label)
+        self.content_layout.addWidget(self.font_group)
+    
+    def setup_content_stats(self):
+        """Build content statistics section"""
+        self.stats_group = QGroupBox("📊 Content Statistics")
+        layout = QFormLayout(self.stats_group)
+        layout.setSpacing(6)
         
-        # Filename
-        filename_label = QLabel(f"<b>File:</b> {data.get('filename', 'Unknown')}")
-        filename_label.setObjectName("documentValue")
-        layout.addWidget(filename_label)
+        self.word_label = self._add_form_row(layout, "Words:")
+        self.para_label = self._add_form_row(layout, "Paragraphs:")
+        self.page_label = self._add_form_row(layout, "Pages:")
+        self.table_label = self._add_form_row(layout, "Tables:")
         
-        self.content_layout.addWidget(group)
+        # Variable-length heading rows live in their own box under the form
+        self.heading_layout = QVBoxLayout()
+        self.heading_layout.setSpacing(6)
+        layout.addRow(self.heading_layout)
         
-    def add_page_settings(self, data: Dict[str, Any]):
-        """Add page settings section"""
-        group = QGroupBox("📏 Page Settings")
-        layout = QVBoxLayout(group)
-        layout.setSpacing(8)
+        self.heading_label = self._add_value_label(self.heading_layout, "documentInfo")
+        self.heading_label.setText("Headings:")
         
-        # Page dimensions
-        dimensions = data.get('page_dimensions', {})
-        width = dimensions.get('width', 0)
-        height = dimensions.get('height', 0)
-        dim_label = QLabel(f"<b>Size:</b> {width:.1f}″ × {height:.1f}″ <span style='color: #757575; font-style: italic;'>(inches)</span>")
-        dim_label.setObjectName("documentValue")
-        layout.addWidget(dim_label)
-        
-        # Margins
-        margins = data.get('margins', {})
-        margin_text = f"<b>Margins:</b><br/>" \
-                     f"• Top: {margins.get('top', 0):.1f}″<br/>" \
-                     f"• Bottom: {margins.get('bottom', 0):.1f}″<br/>" \
-                     f"• Left: {margins.get('left', 0):.1f}″<br/>" \
-                     f"• Right: {margins.get('right', 0):.1f}″<br/>" \
-                     f"<span style='color: #757575; font-style: italic; font-size: 11px;'>(all measurements in inches)</span>"
-        margin_label = QLabel(margin_text)
-        margin_label.setObjectName("documentValue")
-        layout.addWidget(margin_label)
-        
-        self.content_layout.addWidget(group)
-        
-    def add_font_info(self, data: Dict[str, Any]):
-        """Add font information section"""
-        group = QGroupBox("🔤 Fonts Used")
-        layout = QVBoxLayout(group)
-        layout.setSpacing(6)
+        self.content_layout.addWidget(self.stats_group)
+    
+    def show_placeholder(self):
+        """Show placeholder when no document is loaded"""
+        self.set_sections_visible(False)
+    
+    def set_sections_visible(self, visible: bool):
+        """Toggle between the placeholder and the document sections"""
+        self.placeholder_label.setVisible(not visible)
+        self.info_group.setVisible(visible)
+        self.page_group.setVisible(visible)
+        self.font_group.setVisible(visible)
+        self.stats_group.setVisible(visible)
+    
+    def _fill_label_pool(self, pool: List[QLabel], layout: QVBoxLayout, texts: List[str], indent: int = 0):
+        """Show one pooled label per text, growing the pool on demand and hiding the tail"""
+        while len(pool) < len(texts):
+            label = self._add_value_label(layout)
+            label.setIndent(indent)
+            pool.append(label)
         
-        fonts = data.get('fonts_used', {})
-        if fonts:
-            for font_name, count in sorted(fonts.items(), key=lambda x: x[1], reverse=True):
-                font_label = QLabel(f"<b>{font_name}:</b> {count} occurrences")
-                font_label.setObjectName("documentValue")
-                layout.addWidget(font_label)
-        else:
-            no_fonts_label = QLabel("No font information available")
-            no_fonts_label.setObjectName("measurementUnit")
-            layout.addWidget(no_fonts_label)
-            
-        self.content_layout.addWidget(group)
+        for label, text in zip(pool, texts):
+            label.setText(text)
+            label.show()
         
-    def add_content_stats(self, data: Dict[str, Any]):
-        """Add content statistics section"""
-        group = QGroupBox("📊 Content Statistics")
-        layout = QVBoxLayout(group)
-        layout.setSpacing(6)
+        for label in pool[len(texts):]:
+            label.hide()
+    
+    def update_document(self, document_data: Dict[str, Any]):
+        """Update the overview with document data"""
+        # Unpack the document data once and hand plain values to the sections
+        data = document_data
+        dimensions = data.get('page_dimensions') or {}
+        margins = data.get('margins') or {}
         
-        # Word count
-        word_count = data.get('word_count', 0)
-        word_label = QLabel(f"<b>Words:</b> {word_count:,}")
-        word_label.setObjectName("documentValue")
-        layout.addWidget(word_label)
-        
-        # Paragraph count
-        para_count = data.get('paragraph_count', 0)
-        para_label = QLabel(f"<b>Paragraphs:</b> {para_count:,}")
-        para_label.setObjectName("documentValue")
-        layout.addWidget(para_label)
-        
-        # Page count
-        page_count = data.get('page_count', 0)
-        page_label = QLabel(f"<b>Pages:</b> {page_count:,}")
-        page_label.setObjectName("documentValue")
-        layout.addWidget(page_label)
-        
-        # Table count
-        table_count = data.get('table_count', 0)
-        table_label = QLabel(f"<b>Tables:</b> {table_count:,}")
-        table_label.setObjectName("documentValue")
-        layout.addWidget(table_label)
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            # Document info section
+            self.update_document_info(
+                data.get('title', 'Untitled'),
+                data.get('author', 'Unknown'),
+                data.get('file_type', 'Unknown'),
+                data.get('filename', 'Unknown')
+            )
+            
+            # Page settings section
+            self.update_page_settings(
+                dimensions.get('width', 0),
+                dimensions.get('height', 0),
+                *(margins.get(side, 0) for side in _MARGIN_SIDES)
+            )
+            
+            # Font information section
+            self.update_font_info(data.get('fonts_used') or {})
+            
+            # Content statistics section
+            self.update_content_stats(
+                data.get('word_count', 0),
+                data.get('paragraph_count', 0),
+                data.get('page_count', 0),
+                data.get('table_count', 0),
+                data.get('heading_counts') or {}
+            )
+            
+            self.set_sections_visible(True)
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
+    
+    def update_document_info(self, title: str, author: str, file_type: str, filename: str):
+        """Update document information section"""
+        self.title_label.setText(title)
+        self.author_label.setText(author)
+        self.file_type_label.setText(file_type.upper())
+        self.filename_label.setText(filename)
+    
+    def update_page_settings(self, width: float, height: float,
+                             top: float, bottom: float, left: float, right: float):
+        """Update page settings section"""
+        self.dim_label.setText(_SIZE_FMT.format(width, height))
+        self.margin_top_label.setText(_INCHES_FMT.format(top))
+        self.margin_bottom_label.setText(_INCHES_FMT.format(bottom))
+        self.margin_left_label.setText(_INCHES_FMT.format(left))
+        self.margin_right_label.setText(_INCHES_FMT.format(right))
+    
+    def update_font_info(self, fonts: Dict[str, int]):
+        """Update font information section"""
+        items = fonts.items()
+        if len(items) > _MAX_FONT_ROWS:
+            top_fonts = heapq.nlargest(_MAX_FONT_ROWS, items, key=itemgetter(1))
+        else:
+            top_fonts = sorted(items, key=itemgetter(1), reverse=True)
+            
+        # Reuse pooled key / value rows, growing the pool on demand and hiding the tail
+        pool = self._font_row_pool
+        while len(pool) < len(top_fonts):
+            pool.append(self._add_key_value_row(self.font_layout))
+            
+        for (key_label, value_label), (font_name, count) in zip(pool, top_fonts):
+            key_label.setText(_FONT_KEY_FMT.format(font_name))
+            value_label.setText(_FONT_COUNT_FMT.format(count))
+            key_label.show()
+            value_label.show()
+            
+        for key_label, value_label in pool[len(top_fonts):]:
+            key_label.hide()
+            value_label.hide()
+            
+        self.no_fonts_label.setVisible(not fonts)
+    
+    def update_content_stats(self, word_count: int, paragraph_count: int, page_count: int,
+                             table_count: int, headings: Dict[str, int]):
+        """Update content statistics section"""
+        self.word_label.setText(_COUNT_FMT.format(word_count))
+        self.para_label.setText(_COUNT_FMT.format(paragraph_count))
+        self.page_label.setText(_COUNT_FMT.format(page_count))
+        self.table_label.setText(_COUNT_FMT.format(table_count))
         
         # Heading counts
-        headings = data.get('heading_counts', {})
-        if any(headings.values()):
-            heading_label = QLabel("<b>Headings:</b>")
-            heading_label.setObjectName("documentInfo")
-            layout.addWidget(heading_label)
-            
-            for level, count in headings.items():
-                if count > 0:
-                    level_label = QLabel(f"  • {level}: {count}")
-                    level_label.setObjectName("documentValue")
-                    level_label.setIndent(20)
-                    layout.addWidget(level_label)
-        
-        self.content_layout.addWidget(group)
+        texts = [_HEADING_FMT.format(level, count) for level, count in headings.items() if count > 0]
+        self._fill_label_pool(self._heading_label_pool, self.heading_layout, texts, indent=20)
+        self.heading_label.setVisible(bool(texts))
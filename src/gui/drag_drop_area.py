@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent
 from pathlib import Path
+from typing import Optional
 import logging
 
 from ..utils.file_validator import validate_file, is_supported_extension
@@ -19,6 +20,9 @@ class DragDropArea(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
+        self._drop_active = False
+        self._last_url: Optional[str] = None
+        self._last_url_supported = False
         self.setup_ui()
         self.setAcceptDrops(True)
         self.setObjectName("dragDropArea")
@@ -28,6 +32,14 @@ class DragDropArea(QWidget):
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
+        # Pre-styled overlay shown while a supported file is dragged over the area.
+        # Created before the labels so it is painted underneath them.
+        self.active_overlay = QWidget(self)
+        self.active_overlay.setObjectName("dragDropOverlay")
+        self.active_overlay.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.active_overlay.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        self.active_overlay.hide()
+        
         # Main label
         self.main_label = QLabel("Drop DOCX or RTF files here")
         self.main_label.setObjectName("dragDropLabel")
@@ -44,33 +56,59 @@ class DragDropArea(QWidget):
         # Set minimum size
         self.setMinimumSize(400, 200)
         
+    def resizeEvent(self, event):
+        """Keep the active overlay covering the whole area"""
+        self.active_overlay.setGeometry(self.rect())
+        super().resizeEvent(event)
+        
+    def set_drop_active(self, active: bool):
+        """Show or hide the active overlay when the drop state changes"""
+        if active == self._drop_active:
+            return
+            
+        self._drop_active = active
+        self.active_overlay.setVisible(active)
+        
+    def reset_drag_cache(self):
+        """Forget the extension check cached for the current drag"""
+        self._last_url = None
+        self._last_url_supported = False
+        
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event"""
-        if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
-            if urls and len(urls) == 1:
-                file_path = Path(urls[0].toLocalFile())
-                if is_supported_extension(file_path):
-                    event.acceptProposedAction()
-                    self.setProperty("dropActive", True)
-                    self.style().unpolish(self)
-                    self.style().polish(self)
-                    return
-        
-        event.ignore()
+        mime_data = event.mimeData()
+        if not mime_data.hasUrls():
+            event.ignore()
+            return
+            
+        urls = mime_data.urls()
+        if len(urls) != 1 or not urls[0].isLocalFile():
+            event.ignore()
+            return
+            
+        # Only build the Path and check the extension once per dragged URL
+        url_str = urls[0].toString()
+        if url_str != self._last_url:
+            self._last_url = url_str
+            self._last_url_supported = is_supported_extension(Path(urls[0].toLocalFile()))
+            
+        if not self._last_url_supported:
+            event.ignore()
+            return
+            
+        event.acceptProposedAction()
+        self.set_drop_active(True)
         
     def dragLeaveEvent(self, event):
         """Handle drag leave event"""
-        self.setProperty("dropActive", False)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        self.reset_drag_cache()
+        self.set_drop_active(False)
         super().dragLeaveEvent(event)
         
     def dropEvent(self, event: QDropEvent):
         """Handle drop event"""
-        self.setProperty("dropActive", False)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        self.reset_drag_cache()
+        self.set_drop_active(False)
         
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
@@ -80,10 +118,10 @@ class DragDropArea(QWidget):
                 # Validate file
                 is_valid, error_msg = validate_file(file_path)
                 if is_valid:
-                    self.logger.info(f"File dropped and validated: {file_path}")
+                    self.logger.info("File dropped and validated: %s", file_path)
                     self.file_dropped.emit(file_path)
                 else:
-                    self.logger.warning(f"File dropped but validation failed: {error_msg}")
+                    self.logger.warning("File dropped but validation failed: %s", error_msg)
                     self.file_rejected.emit(error_msg)
                     
         event.acceptProposedAction()
@@ -3,24 +3,30 @@ Main application window
 """
 
 import logging
+from dataclasses import replace
 from pathlib import Path
+from typing import Optional
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QSplitter, QMessageBox, QProgressBar, QStatusBar
+    QSplitter, QMessageBox, QProgressBar, QStatusBar, QFileDialog
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QAction, QKeySequence
 
 from .drag_drop_area import DragDropArea
 from .document_overview import DocumentOverview
 from .modification_form import ModificationForm
-from .styles import get_light_theme, get_dark_theme, get_drag_drop_styles
+from .styles import apply_theme
 from ..processors.document_processor import DocumentProcessor
 from ..config.settings import AppSettings
 
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    # Requests dispatched to the background worker
+    process_requested = pyqtSignal(Path)
+    apply_requested = pyqtSignal(dict, dict)
+    
     def __init__(self, settings: AppSettings):
         super().__init__()
         self.settings = settings
@@ -28,11 +34,28 @@ class MainWindow(QMainWindow):
         self.document_processor = DocumentProcessor()
         self.current_document = None
         
+        self.setup_worker()
         self.setup_ui()
         self.setup_menu()
         self.setup_status_bar()
         self.apply_theme()
         
+    def setup_worker(self):
+        """Start the persistent worker thread used for document processing"""
+        self.worker_thread = QThread(self)
+        self.worker = DocumentWorker(self.document_processor)
+        self.worker.moveToThread(self.worker_thread)
+        
+        # Cross-thread signals are always queued so they stay thread-safe
+        self.process_requested.connect(self.worker.process, Qt.ConnectionType.QueuedConnection)
+        self.apply_requested.connect(self.worker.apply, Qt.ConnectionType.QueuedConnection)
+        self.worker.document_processed.connect(self.on_document_processed, Qt.ConnectionType.QueuedConnection)
+        self.worker.error_occurred.connect(self.on_processing_error, Qt.ConnectionType.QueuedConnection)
+        self.worker.settings_applied.connect(self.on_settings_applied_success, Qt.ConnectionType.QueuedConnection)
+        self.worker.apply_error_occurred.connect(self.on_apply_error, Qt.ConnectionType.QueuedConnection)
+        
+        self.worker_thread.start()
+        
     def setup_ui(self):
         """Setup the main UI"""
         self.setWindowTitle("WPDAdjuster - Word Processing Document Adjuster")
@@ -47,33 +70,40 @@ class MainWindow(QMainWindow):
         main_layout.setContentsMargins(10, 10, 10, 10)
         
         # Create splitter for resizable panels
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        main_layout.addWidget(splitter)
+        self.splitter = QSplitter(Qt.Orientation.Horizontal)
+        main_layout.addWidget(self.splitter)
         
         # Left panel - Document overview and drag drop
         left_panel = QWidget()
-        left_layout = QVBoxLayout(left_panel)
+        self.left_layout = QVBoxLayout(left_panel)
         
         # Drag drop area
         self.drag_drop_area = DragDropArea()
-        self.drag_drop_area.file_dropped.connect(self.on_file_dropped)
-        self.drag_drop_area.file_rejected.connect(self.on_file_rejected)
-        left_layout.addWidget(self.drag_drop_area)
+        self.drag_drop_area.file_dropped.connect(self.on_file_dropped, Qt.ConnectionType.DirectConnection)
+        self.drag_drop_area.file_rejected.connect(self.on_file_rejected, Qt.ConnectionType.DirectConnection)
+        self.left_layout.addWidget(self.drag_drop_area)
+        
+        # Document overview and modification form are built on first document load
+        self.document_overview: Optional[DocumentOverview] = None
+        self.modification_form: Optional[ModificationForm] = None
         
+        # Add panels to splitter
+        self.splitter.addWidget(left_panel)
+        
+    def ensure_document_panels(self):
+        """Create the document overview and modification form on first use"""
+        if self.document_overview is not None:
+            return
+            
         # Document overview
         self.document_overview = DocumentOverview()
-        self.document_overview.hide()  # Initially hidden
-        left_layout.addWidget(self.document_overview)
+        self.left_layout.addWidget(self.document_overview)
         
         # Right panel - Modification form
         self.modification_form = ModificationForm()
-        self.modification_form.hide()  # Initially hidden
-        self.modification_form.settings_applied.connect(self.on_settings_applied)
-        
-        # Add panels to splitter
-        splitter.addWidget(left_panel)
-        splitter.addWidget(self.modification_form)
-        splitter.setSizes([400, 600])  # Initial sizes
+        self.modification_form.settings_applied.connect(self.on_settings_applied, Qt.ConnectionType.DirectConnection)
+        self.splitter.addWidget(self.modification_form)
+        self.splitter.setSizes([400, 600])  # Initial sizes
         
     def setup_menu(self):
         """Setup menu bar"""
@@ -113,17 +143,34 @@ class MainWindow(QMainWindow):
         
         self.status_bar.showMessage("Ready - Drop a document to begin")
         
+        # Coalesce status and progress changes into at most one refresh per 100 ms
+        self._pending_status = ""
+        self._pending_busy = False
+        self._ui_refresh_timer = QTimer(self)
+        self._ui_refresh_timer.setSingleShot(True)
+        self._ui_refresh_timer.setInterval(100)
+        self._ui_refresh_timer.timeout.connect(self._flush_ui_state)
+        
+    def update_status(self, message: str, busy: bool = False):
+        """Queue a status message and progress state for the next UI refresh"""
+        self._pending_status = message
+        self._pending_busy = busy
+        if not self._ui_refresh_timer.isActive():
+            self._ui_refresh_timer.start()
+            
+    def _flush_ui_state(self):
+        """Apply the latest queued status message and progress state"""
+        if self._pending_busy:
+            self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        self.progress_bar.setVisible(self._pending_busy)
+        self.status_bar.showMessage(self._pending_status)
+        
     def apply_theme(self):
         """Apply current theme"""
-        theme_style = get_dark_theme() if self.settings.is_dark_theme else get_light_theme()
-        drag_drop_style = get_drag_drop_styles()
-        
-        self.setStyleSheet(theme_style + drag_drop_style)
+        apply_theme(self, self.settings.theme)
         
     def open_file_dialog(self):
         """Open file dialog for document selection"""
-        from PyQt6.QtWidgets import QFileDialog
-        
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Open Document",
@@ -144,41 +191,41 @@ class MainWindow(QMainWindow):
         
     def process_document(self, file_path: Path):
         """Process dropped or selected document"""
-        self.logger.info(f"Processing document: {file_path}")
-        self.status_bar.showMessage("Processing document...")
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        self.logger.info("Processing document: %s", file_path)
+        self.update_status("Processing document...", busy=True)
         
-        # Process document in thread to avoid UI freezing
-        self.process_thread = DocumentProcessThread(file_path, self.document_processor)
-        self.process_thread.document_processed.connect(self.on_document_processed)
-        self.process_thread.error_occurred.connect(self.on_processing_error)
-        self.process_thread.start()
+        # Process document on the worker thread to avoid UI freezing
+        self.process_requested.emit(file_path)
         
     def on_document_processed(self, document_data: dict):
         """Handle successful document processing"""
         self.current_document = document_data
         self.logger.info("Document processed successfully")
         
-        # Update UI
-        self.document_overview.update_document(document_data)
-        self.document_overview.show()
-        
-        self.modification_form.update_document(document_data)
-        self.modification_form.show()
-        
-        self.drag_drop_area.hide()
-        
-        self.progress_bar.setVisible(False)
-        self.status_bar.showMessage(f"Document loaded: {document_data.get('filename', 'Unknown')}")
+        # Update UI with repaints frozen so the layout is recomputed once
+        self.setUpdatesEnabled(False)
+        try:
+            self.ensure_document_panels()
+            
+            self.document_overview.update_document(document_data)
+            self.document_overview.show()
+            
+            self.modification_form.update_document(document_data)
+            self.modification_form.show()
+            
+            self.drag_drop_area.hide()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+            
+        self.update_status(f"Document loaded: {document_data.get('filename', 'Unknown')}")
         
     def on_processing_error(self, error_message: str):
         """Handle document processing error"""
-        self.logger.error(f"Document processing error: {error_message}")
+        self.logger.error("Document processing error: %s", error_message)
         QMessageBox.critical(self, "Processing Error", f"Failed to process document:\n{error_message}")
         
-        self.progress_bar.setVisible(False)
-        self.status_bar.showMessage("Ready - Drop a document to begin")
+        self.update_status("Ready - Drop a document to begin")
         
     def on_settings_applied(self, settings: dict):
         """Handle modification settings applied"""
@@ -186,71 +233,63 @@ class MainWindow(QMainWindow):
             return
             
         self.logger.info("Applying modification settings")
-        self.status_bar.showMessage("Applying modifications...")
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)
+        self.update_status("Applying modifications...", busy=True)
         
-        # Apply modifications in thread
-        self.apply_thread = SettingsApplyThread(self.current_document, settings, self.document_processor)
-        self.apply_thread.settings_applied.connect(self.on_settings_applied_success)
-        self.apply_thread.error_occurred.connect(self.on_apply_error)
-        self.apply_thread.start()
+        # Apply modifications on the worker thread
+        self.apply_requested.emit(self.current_document, settings)
         
     def on_settings_applied_success(self, output_path: Path):
         """Handle successful settings application"""
-        self.logger.info(f"Settings applied successfully: {output_path}")
+        self.logger.info("Settings applied successfully: %s", output_path)
         QMessageBox.information(self, "Success", f"Document modified and saved to:\n{output_path}")
         
-        self.progress_bar.setVisible(False)
-        self.status_bar.showMessage("Settings applied successfully")
+        self.update_status("Settings applied successfully")
         
     def on_apply_error(self, error_message: str):
         """Handle settings application error"""
-        self.logger.error(f"Settings application error: {error_message}")
+        self.logger.error("Settings application error: %s", error_message)
         QMessageBox.critical(self, "Application Error", f"Failed to apply settings:\n{error_message}")
         
-        self.progress_bar.setVisible(False)
-        self.status_bar.showMessage("Ready")
+        self.update_status("Ready")
         
     def toggle_theme(self):
         """Toggle between light and dark theme"""
-        self.settings.theme = "dark" if self.settings.theme == "light" else "light"
+        new_theme = "dark" if self.settings.theme == "light" else "light"
+        self.settings = replace(self.settings, theme=new_theme)
         self.apply_theme()
-        self.logger.info(f"Theme changed to: {self.settings.theme}")
+        self.logger.info("Theme changed to: %s", self.settings.theme)
+        
+    def closeEvent(self, event):
+        """Stop the worker thread before the window closes"""
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        super().closeEvent(event)
 
-class DocumentProcessThread(QThread):
-    """Thread for processing documents"""
+class DocumentWorker(QObject):
+    """Worker that processes documents and applies settings on a background thread"""
     document_processed = pyqtSignal(dict)
     error_occurred = pyqtSignal(str)
+    settings_applied = pyqtSignal(Path)
+    apply_error_occurred = pyqtSignal(str)
     
-    def __init__(self, file_path: Path, processor: DocumentProcessor):
+    def __init__(self, processor: DocumentProcessor):
         super().__init__()
-        self.file_path = file_path
         self.processor = processor
         
-    def run(self):
+    @pyqtSlot(Path)
+    def process(self, file_path: Path):
         """Run document processing"""
         try:
-            document_data = self.processor.process_document(self.file_path)
+            document_data = self.processor.process_document(file_path)
             self.document_processed.emit(document_data)
         except Exception as e:
             self.error_occurred.emit(str(e))
-
-class SettingsApplyThread(QThread):
-    """Thread for applying modification settings"""
-    settings_applied = pyqtSignal(Path)
-    error_occurred = pyqtSignal(str)
-    
-    def __init__(self, document_data: dict, settings: dict, processor: DocumentProcessor):
-        super().__init__()
-        self.document_data = document_data
-        self.settings = settings
-        self.processor = processor
-        
-    def run(self):
+            
+    @pyqtSlot(dict, dict)
+    def apply(self, document_data: dict, settings: dict):
         """Run settings application"""
         try:
-            output_path = self.processor.apply_modifications(self.document_data, self.settings)
+            output_path = self.processor.apply_modifications(document_data, settings)
             self.settings_applied.emit(output_path)
         except Exception as e:
-            self.error_occurred.emit(str(e))
+            self.apply_error_occurred.emit(str(e))
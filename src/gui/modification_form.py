@@ -2,16 +2,225 @@
 Modification form widget for document settings
 """
 
+import hashlib
+import json
 import logging
+import os
+from operator import itemgetter
+from pathlib import Path
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QGroupBox, QComboBox, QSpinBox, QDoubleSpinBox,
     QPushButton, QLineEdit, QFormLayout, QScrollArea,
-    QFrame, QMessageBox
+    QFrame, QMessageBox, QStackedWidget, QCompleter, QStyledItemDelegate
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFontDatabase
-from typing import Dict, Any, List
+from PyQt6.QtCore import Qt, QCoreApplication, QSignalBlocker, QStringListModel, QThread, pyqtSignal
+from PyQt6.QtGui import QFontDatabase, QPalette
+from typing import Dict, Any, List, Optional, Tuple, Callable
+
+# Fonts listed at the top of the font family dropdown
+_COMMON_FONTS = ["Times New Roman", "Arial", "Calibri", "Helvetica", "Georgia", "Verdana", "Courier New"]
+_COMMON_FONT_SET = frozenset(_COMMON_FONTS)
+
+# Standard page sizes (width, height) in inches, in dropdown order
+_PAGE_SIZES = {"A4": (8.27, 11.69), "Letter": (8.5, 11.0), "Legal": (8.5, 14.0)}
+
+# Standard page sizes keyed by dimensions rounded to a tenth of an inch
+_PAGE_SIZE_LOOKUP = {(round(width, 1), round(height, 1)): name for name, (width, height) in _PAGE_SIZES.items()}
+
+# Line spacing presets and their multipliers, in dropdown order
+_LINE_SPACING_MAP = {"Single (1.0)": 1.0, "1.15": 1.15, "1.5": 1.5, "Double (2.0)": 2.0}
+
+# Margin sides and their form labels, in display order
+_MARGIN_SIDES = {'top': "Top:", 'bottom': "Bottom:", 'left': "Left:", 'right': "Right:"}
+
+# System font families, enumerated once per process on first use
+_FONT_FAMILIES_CACHE: Optional[Tuple[str, ...]] = None
+_FONT_LOADER: Optional["FontLoaderThread"] = None
+
+# On-disk font family cache, invalidated when any font directory changes
+_FONT_CACHE_FILE = Path.home() / ".cache" / "WPDAdjuster" / "fonts.json"
+_FONT_DIRS = (
+    Path("/usr/share/fonts"),
+    Path("/usr/local/share/fonts"),
+    Path.home() / ".fonts",
+    Path.home() / ".local" / "share" / "fonts",
+    Path.home() / "Library" / "Fonts",
+    Path("/Library/Fonts"),
+    Path("/System/Library/Fonts"),
+    Path("C:/Windows/Fonts"),
+    # fontconfig caches are rewritten whenever fc-cache picks up new fonts
+    Path("/var/cache/fontconfig"),
+    Path.home() / ".cache" / "fontconfig"
+)
+
+def _font_dirs_signature() -> Optional[str]:
+    """Hash the modification times of the font directories and their subdirectories"""
+    digest = hashlib.sha1()
+    found = False
+    for font_dir in _FONT_DIRS:
+        try:
+            mtime = font_dir.stat().st_mtime_ns
+        except OSError:
+            continue
+        found = True
+        digest.update(f"{font_dir}:{mtime};".encode())
+        
+        # Font packages install into subdirectories without touching the parent's mtime
+        try:
+            with os.scandir(font_dir) as entries:
+                subdirs = sorted(
+                    (entry.name, entry.stat().st_mtime_ns)
+                    for entry in entries if entry.is_dir()
+                )
+        except OSError:
+            continue
+        for name, sub_mtime in subdirs:
+            digest.update(f"{name}:{sub_mtime};".encode())
+            
+    # Without any directory to watch the cache could never be invalidated
+    return digest.hexdigest() if found else None
+
+def _load_cached_font_families(signature: str) -> Optional[List[str]]:
+    """Return the cached font families if the cache matches the signature"""
+    try:
+        with open(_FONT_CACHE_FILE, encoding="utf-8") as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("signature") != signature:
+        return None
+    families = cache.get("families")
+    return families if isinstance(families, list) else None
+
+def _save_cached_font_families(signature: str, families: Tuple[str, ...]) -> None:
+    """Write the font families and their signature to the disk cache"""
+    try:
+        _FONT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_FONT_CACHE_FILE, "w", encoding="utf-8") as cache_file:
+            json.dump({"signature": signature, "families": list(families)}, cache_file)
+    except OSError as e:
+        logging.getLogger(__name__).warning("Could not write font cache %s: %s", _FONT_CACHE_FILE, e)
+
+def _get_font_families() -> Tuple[str, ...]:
+    """Return the sorted system font families, querying QFontDatabase only once"""
+    global _FONT_FAMILIES_CACHE
+    if _FONT_FAMILIES_CACHE is None:
+        signature = _font_dirs_signature()
+        cached = _load_cached_font_families(signature) if signature else None
+        if cached is not None:
+            _FONT_FAMILIES_CACHE = tuple(cached)
+            return _FONT_FAMILIES_CACHE
+            
+        try:
+            families = QFontDatabase.families(QFontDatabase.WritingSystem.Any)
+        except (RuntimeError, TypeError) as e:
+            # Fallback to common fonts if QFontDatabase fails
+            logging.getLogger(__name__).warning("QFontDatabase unavailable: %s", e)
+            families = []
+        _FONT_FAMILIES_CACHE = tuple(sorted(families))
+        if _FONT_FAMILIES_CACHE and signature:
+            _save_cached_font_families(signature, _FONT_FAMILIES_CACHE)
+    return _FONT_FAMILIES_CACHE
+
+class FontLoaderThread(QThread):
+    """Thread that warms the font family cache off the GUI thread"""
+    families_ready = pyqtSignal(list)
+    
+    def run(self):
+        """Enumerate system font families"""
+        self.families_ready.emit(list(_get_font_families()))
+
+def _start_font_loader() -> Optional[FontLoaderThread]:
+    """Start background font enumeration unless it has finished; returns the running loader"""
+    global _FONT_LOADER
+    if _FONT_FAMILIES_CACHE is not None:
+        return None
+    if _FONT_LOADER is None:
+        _FONT_LOADER = FontLoaderThread()
+        
+        # Enumeration cannot be interrupted; let it finish before the application tears down
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(_FONT_LOADER.wait)
+        _FONT_LOADER.start()
+    return _FONT_LOADER
+
+class FontDividerDelegate(QStyledItemDelegate):
+    """Item delegate that draws a divider line below one row of the font list"""
+    
+    def __init__(self, divider_row: int, parent=None):
+        super().__init__(parent)
+        self.divider_row = divider_row
+        
+    def paint(self, painter, option, index):
+        """Paint the item, adding the divider under the configured row"""
+        super().paint(painter, option, index)
+        if index.row() == self.divider_row:
+            painter.save()
+            painter.setPen(option.palette.color(QPalette.ColorRole.Mid))
+            painter.drawLine(option.rect.bottomLeft(), option.rect.bottomRight())
+            painter.restore()
+
+class LazyFontComboBox(QComboBox):
+    """Font family combo box that defers the full font list until it is first opened"""
+    
+    def __init__(self, populate: Callable[[], None], is_listed: Callable[[str], bool],
+                 default_family: str = "Times New Roman", parent=None):
+        super().__init__(parent)
+        self._populate = populate
+        self._is_listed = is_listed
+        self._default_family = default_family
+        self._populated = False
+        
+        # Plain string model; avoids a QStandardItem per font family
+        self.setModel(QStringListModel([default_family], self))
+        
+    def set_families(self, families: List[str]) -> None:
+        """Replace the font list in a single model update"""
+        self.model().setStringList(families)
+        
+    def set_current_family(self, family: str) -> None:
+        """Select a font family, falling back to the first entry if it is not in the list"""
+        if not self._populated:
+            # Show what the full list would select so both states apply the same font
+            self.setItemText(0, family if self._is_listed(family) else self._default_family)
+            return
+            
+        self.setCurrentIndex(max(self.findText(family), 0))
+        
+    def current_family(self) -> str:
+        """Return the list entry matching the typed text, falling back to the selected entry"""
+        index = self.findText(self.currentText(), Qt.MatchFlag.MatchFixedString)
+        if index < 0:
+            index = max(self.currentIndex(), 0)
+        family = self.itemText(index)
+        
+        # Show the family that will actually be applied
+        self.setCurrentIndex(index)
+        self.setEditText(family)
+        return family
+            
+    def ensure_populated(self) -> None:
+        """Replace the placeholder with the full font list, keeping the current font"""
+        if self._populated:
+            return
+            
+        self._populated = True
+        current = self.currentText()
+        self.clear()
+        self._populate()
+        self.setCurrentIndex(max(self.findText(current), 0))
+        
+    def showPopup(self):
+        """Populate the full font list on first open"""
+        self.ensure_populated()
+        super().showPopup()
+        
+    def focusInEvent(self, event):
+        """Populate the full font list before the user starts typing a name"""
+        self.ensure_populated()
+        super().focusInEvent(event)
 
 class ModificationForm(QWidget):
     """Form widget for modifying document settings"""
@@ -22,6 +231,13 @@ class ModificationForm(QWidget):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
         self.document_data = None
+        self._awaiting_font_families = False
+        
+        # Enumerate system fonts in the background while the form is in use
+        font_loader = _start_font_loader()
+        if font_loader is not None:
+            font_loader.families_ready.connect(self._append_extra_families)
+            
         self.setup_ui()
         
     def setup_ui(self):
@@ -29,17 +245,34 @@ class ModificationForm(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         
+        # Stack switching between the placeholder and the form
+        self.stack = QStackedWidget()
+        layout.addWidget(self.stack)
+        
+        # Placeholder shown when no document is loaded
+        self.placeholder_label = QLabel("Load a document to modify settings")
+        self.placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.placeholder_label.setStyleSheet("color: #757575; font-style: italic;")
+        self.stack.addWidget(self.placeholder_label)
+        
         # Create scroll area for form content
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameStyle(QFrame.Shape.NoFrame)
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setFrameStyle(QFrame.Shape.NoFrame)
         
         # Form content widget
         self.form_widget = QWidget()
         self.form_layout = QVBoxLayout(self.form_widget)
         
-        scroll_area.setWidget(self.form_widget)
-        layout.addWidget(scroll_area)
+        # Groups are built once and updated in place for each document
+        self.add_rtf_warning()
+        self.add_page_settings_group()
+        self.add_margin_settings_group()
+        self.add_font_settings_group()
+        self.add_line_spacing_group()
+        
+        self.scroll_area.setWidget(self.form_widget)
+        self.stack.addWidget(self.scroll_area)
         
         # Apply button (outside scroll area)
         self.apply_button = QPushButton("Apply Modifications")
@@ -52,48 +285,44 @@ class ModificationForm(QWidget):
         
     def show_placeholder(self):
         """Show placeholder when no document is loaded"""
-        self.clear_content()
-        
-        placeholder = QLabel("Load a document to modify settings")
-        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        placeholder.setStyleSheet("color: #757575; font-style: italic;")
-        self.form_layout.addWidget(placeholder)
-        
-    def clear_content(self):
-        """Clear all content from the form"""
-        while self.form_layout.count():
-            child = self.form_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-                
+        self.stack.setCurrentWidget(self.placeholder_label)
+        
     def update_document(self, document_data: Dict[str, Any]):
         """Update the form with document data"""
         self.document_data = document_data
-        self.clear_content()
-        
-        # Add RTF warning if applicable
-        if document_data.get('file_type') == 'rtf':
-            self.add_rtf_warning()
-        
-        # Page settings group
-        self.add_page_settings_group()
-        
-        # Margin settings group
-        self.add_margin_settings_group()
-        
-        # Font settings group
-        self.add_font_settings_group()
-        
-        # Line spacing group
-        self.add_line_spacing_group()
         
+        # Freeze repaints so the form is laid out and painted once
+        self.form_widget.setUpdatesEnabled(False)
+        try:
+            # RTF notice and page size availability
+            is_rtf = document_data.get('file_type') == 'rtf'
+            self.rtf_warning_group.setVisible(is_rtf)
+            self.page_size_combo.setEnabled(not is_rtf)
+            self.custom_width.setEnabled(not is_rtf)
+            self.custom_height.setEnabled(not is_rtf)
+            self.page_unit_info.setText(
+                "Page size changes not supported for RTF files" if is_rtf
+                else "All measurements are in inches"
+            )
+            
+            # Current document values, with defaults for settings not read from the document
+            self.set_current_page_size()
+            self.set_current_margins()
+            self.set_current_font()
+            self.font_size.setValue(12)
+            self.line_spacing_combo.setCurrentIndex(0)
+            
+            self.stack.setCurrentWidget(self.scroll_area)
+        finally:
+            self.form_widget.setUpdatesEnabled(True)
+            
         # Enable apply button
         self.apply_button.setEnabled(True)
         
     def add_rtf_warning(self):
         """Add warning for RTF files about limitations"""
-        warning_group = QGroupBox("⚠️ RTF File Notice")
-        layout = QVBoxLayout(warning_group)
+        self.rtf_warning_group = QGroupBox("⚠️ RTF File Notice")
+        layout = QVBoxLayout(self.rtf_warning_group)
         
         warning_text = QLabel(
             "<b>RTF Format Limitations:</b><br/>"
@@ -106,7 +335,8 @@ class ModificationForm(QWidget):
         warning_text.setWordWrap(True)
         layout.addWidget(warning_text)
         
-        self.form_layout.addWidget(warning_group)
+        self.rtf_warning_group.hide()
+        self.form_layout.addWidget(self.rtf_warning_group)
         
     def add_page_settings_group(self):
         """Add page size settings group"""
@@ -114,46 +344,25 @@ class ModificationForm(QWidget):
         layout = QFormLayout(group)
         layout.setSpacing(8)
         
-        # Check if RTF file
-        is_rtf = self.document_data and self.document_data.get('file_type') == 'rtf'
-        
         # Page size dropdown
         self.page_size_combo = QComboBox()
-        self.page_size_combo.addItems(["A4", "Letter", "Legal", "Custom"])
+        self.page_size_combo.addItems([*_PAGE_SIZES, "Custom"])
         self.page_size_combo.currentTextChanged.connect(self.on_page_size_changed)
-        self.page_size_combo.setEnabled(not is_rtf)
         layout.addRow("Size:", self.page_size_combo)
         
         # Custom dimensions (initially hidden)
-        self.custom_width = QDoubleSpinBox()
-        self.custom_width.setRange(1.0, 20.0)
-        self.custom_width.setValue(8.5)
-        self.custom_width.setSuffix(" inches")
-        self.custom_width.setDecimals(2)
-        self.custom_width.setEnabled(not is_rtf)
+        self.custom_width = self._make_inch_spinbox(8.5, minimum=1.0, maximum=20.0)
         self.custom_width.hide()
         layout.addRow("Width:", self.custom_width)
         
-        self.custom_height = QDoubleSpinBox()
-        self.custom_height.setRange(1.0, 30.0)
-        self.custom_height.setValue(11.0)
-        self.custom_height.setSuffix(" inches")
-        self.custom_height.setDecimals(2)
-        self.custom_height.setEnabled(not is_rtf)
+        self.custom_height = self._make_inch_spinbox(11.0, minimum=1.0, maximum=30.0)
         self.custom_height.hide()
         layout.addRow("Height:", self.custom_height)
         
         # Add unit info label
-        if is_rtf:
-            unit_info = QLabel("Page size changes not supported for RTF files")
-            unit_info.setObjectName("measurementUnit")
-        else:
-            unit_info = QLabel("All measurements are in inches")
-            unit_info.setObjectName("measurementUnit")
-        layout.addRow("", unit_info)
-        
-        # Set current page size
-        self.set_current_page_size()
+        self.page_unit_info = QLabel("All measurements are in inches")
+        self.page_unit_info.setObjectName("measurementUnit")
+        layout.addRow("", self.page_unit_info)
         
         self.form_layout.addWidget(group)
         
@@ -164,44 +373,29 @@ class ModificationForm(QWidget):
         layout.setSpacing(8)
         
         # Margin inputs (now supported for both DOCX and RTF)
-        self.margin_top = QDoubleSpinBox()
-        self.margin_top.setRange(0.1, 5.0)
-        self.margin_top.setValue(1.0)
-        self.margin_top.setSuffix(" inches")
-        self.margin_top.setDecimals(2)
-        layout.addRow("Top:", self.margin_top)
-        
-        self.margin_bottom = QDoubleSpinBox()
-        self.margin_bottom.setRange(0.1, 5.0)
-        self.margin_bottom.setValue(1.0)
-        self.margin_bottom.setSuffix(" inches")
-        self.margin_bottom.setDecimals(2)
-        layout.addRow("Bottom:", self.margin_bottom)
-        
-        self.margin_left = QDoubleSpinBox()
-        self.margin_left.setRange(0.1, 5.0)
-        self.margin_left.setValue(1.0)
-        self.margin_left.setSuffix(" inches")
-        self.margin_left.setDecimals(2)
-        layout.addRow("Left:", self.margin_left)
-        
-        self.margin_right = QDoubleSpinBox()
-        self.margin_right.setRange(0.1, 5.0)
-        self.margin_right.setValue(1.0)
-        self.margin_right.setSuffix(" inches")
-        self.margin_right.setDecimals(2)
-        layout.addRow("Right:", self.margin_right)
+        self.margin_spinboxes: Dict[str, QDoubleSpinBox] = {}
+        for side, label in _MARGIN_SIDES.items():
+            spinbox = self._make_inch_spinbox()
+            self.margin_spinboxes[side] = spinbox
+            layout.addRow(label, spinbox)
         
         # Add unit info label
         unit_info = QLabel("All margin measurements are in inches")
         unit_info.setObjectName("measurementUnit")
         layout.addRow("", unit_info)
         
-        # Set current margins
-        self.set_current_margins()
-        
         self.form_layout.addWidget(group)
         
+    def _make_inch_spinbox(self, default: float = 1.0, maximum: float = 5.0,
+                           minimum: float = 0.1) -> QDoubleSpinBox:
+        """Create a spin box for a measurement in inches"""
+        spinbox = QDoubleSpinBox()
+        spinbox.setRange(minimum, maximum)
+        spinbox.setValue(default)
+        spinbox.setSuffix(" inches")
+        spinbox.setDecimals(2)
+        return spinbox
+        
     def add_font_settings_group(self):
         """Add font settings group"""
         group = QGroupBox("🔤 Font Settings")
@@ -209,8 +403,20 @@ class ModificationForm(QWidget):
         layout.setSpacing(8)
         
         # Font family dropdown
-        self.font_family_combo = QComboBox()
-        self.populate_font_families()
+        self.font_family_combo = LazyFontComboBox(self.populate_font_families, self.is_listed_font_family)
+        self.font_family_combo.setItemDelegate(FontDividerDelegate(len(_COMMON_FONTS) - 1, self.font_family_combo))
+        
+        # Size from a fixed text length instead of measuring every font name
+        self.font_family_combo.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon)
+        self.font_family_combo.setMinimumContentsLength(24)
+        
+        # Type-to-search over the font list
+        self.font_family_combo.setEditable(True)
+        self.font_family_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        completer = self.font_family_combo.completer()
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
         layout.addRow("Font Family:", self.font_family_combo)
         
         # Font size
@@ -225,9 +431,6 @@ class ModificationForm(QWidget):
         unit_info.setObjectName("measurementUnit")
         layout.addRow("", unit_info)
         
-        # Set current font
-        self.set_current_font()
-        
         self.form_layout.addWidget(group)
         
     def add_line_spacing_group(self):
@@ -238,13 +441,7 @@ class ModificationForm(QWidget):
         
         # Line spacing dropdown
         self.line_spacing_combo = QComboBox()
-        self.line_spacing_combo.addItems([
-            "Single (1.0)",
-            "1.15",
-            "1.5",
-            "Double (2.0)",
-            "Custom"
-        ])
+        self.line_spacing_combo.addItems([*_LINE_SPACING_MAP, "Custom"])
         self.line_spacing_combo.currentTextChanged.connect(self.on_line_spacing_changed)
         layout.addRow("Spacing:", self.line_spacing_combo)
         
@@ -265,27 +462,34 @@ class ModificationForm(QWidget):
         
     def populate_font_families(self):
         """Populate font family dropdown with system fonts"""
-        try:
-            font_db = QFontDatabase()
-            families = font_db.families(QFontDatabase.WritingSystem.Any)
-        except:
-            # Fallback to common fonts if QFontDatabase fails
-            families = []
+        if _FONT_FAMILIES_CACHE is None:
+            # Background enumeration still running; the rest is appended when it finishes
+            self._awaiting_font_families = True
+            families = ()
+        else:
+            families = _FONT_FAMILIES_CACHE
             
-        # Add common fonts first
-        common_fonts = ["Times New Roman", "Arial", "Calibri", "Helvetica", "Georgia", "Verdana", "Courier New"]
-        for font in common_fonts:
-            self.font_family_combo.addItem(font)
-            if font in families:
-                families.remove(font)
-                
-        # Add separator
-        self.font_family_combo.insertSeparator(self.font_family_combo.count())
-        
-        # Add remaining fonts
-        for font in sorted(families):
-            self.font_family_combo.addItem(font)
+        # Common fonts first, then the remaining fonts (already sorted); the divider is drawn by the delegate
+        self.font_family_combo.set_families(
+            _COMMON_FONTS + [font for font in families if font not in _COMMON_FONT_SET]
+        )
             
+    def is_listed_font_family(self, family: str) -> bool:
+        """Check whether the font dropdown lists a family once it is populated"""
+        if family in _COMMON_FONT_SET:
+            return True
+        # Fonts still being enumerated are appended later and not selected, as in the populated list
+        return _FONT_FAMILIES_CACHE is not None and family in _FONT_FAMILIES_CACHE
+        
+    def _append_extra_families(self, families: List[str]):
+        """Append system fonts to a dropdown that was populated before enumeration finished"""
+        if not self._awaiting_font_families:
+            return
+            
+        self._awaiting_font_families = False
+        self.font_family_combo.addItems([font for font in families if font not in _COMMON_FONT_SET])
+                
+    
     def set_current_page_size(self):
         """Set current page size based on document data"""
         if not self.document_data:
@@ -296,18 +500,19 @@ class ModificationForm(QWidget):
         height = dimensions.get('height', 11.0)
         
         # Determine page size
-        if abs(width - 8.5) < 0.1 and abs(height - 11.0) < 0.1:
-            self.page_size_combo.setCurrentText("Letter")
-        elif abs(width - 8.27) < 0.1 and abs(height - 11.69) < 0.1:
-            self.page_size_combo.setCurrentText("A4")
-        elif abs(width - 8.5) < 0.1 and abs(height - 14.0) < 0.1:
-            self.page_size_combo.setCurrentText("Legal")
-        else:
-            self.page_size_combo.setCurrentText("Custom")
+        page_size = _PAGE_SIZE_LOOKUP.get((round(width, 1), round(height, 1)), "Custom")
+        width, height = _PAGE_SIZES.get(page_size, (width, height))
+        
+        # Update the dependent fields directly instead of through on_page_size_changed
+        with QSignalBlocker(self.page_size_combo), QSignalBlocker(self.custom_width), \
+                QSignalBlocker(self.custom_height):
+            self.page_size_combo.setCurrentText(page_size)
             self.custom_width.setValue(width)
             self.custom_height.setValue(height)
-            self.custom_width.show()
-            self.custom_height.show()
+            
+        is_custom = page_size == "Custom"
+        self.custom_width.setVisible(is_custom)
+        self.custom_height.setVisible(is_custom)
             
     def set_current_margins(self):
         """Set current margins based on document data"""
@@ -315,10 +520,9 @@ class ModificationForm(QWidget):
             return
             
         margins = self.document_data.get('margins', {})
-        self.margin_top.setValue(margins.get('top', 1.0))
-        self.margin_bottom.setValue(margins.get('bottom', 1.0))
-        self.margin_left.setValue(margins.get('left', 1.0))
-        self.margin_right.setValue(margins.get('right', 1.0))
+        for side, spinbox in self.margin_spinboxes.items():
+            with QSignalBlocker(spinbox):
+                spinbox.setValue(margins.get(side, 1.0))
         
     def set_current_font(self):
         """Set current font based on document data"""
@@ -326,53 +530,35 @@ class ModificationForm(QWidget):
             return
             
         fonts = self.document_data.get('fonts_used', {})
-        if fonts:
-            # Get most used font
-            most_used_font = max(fonts.items(), key=lambda x: x[1])[0]
-            index = self.font_family_combo.findText(most_used_font)
-            if index >= 0:
-                self.font_family_combo.setCurrentIndex(index)
+        with QSignalBlocker(self.font_family_combo):
+            if fonts:
+                # Get most used font
+                most_used_font = max(fonts.items(), key=itemgetter(1))[0]
+                self.font_family_combo.set_current_family(most_used_font)
+            else:
+                self.font_family_combo.set_current_family("Times New Roman")
                 
     def on_page_size_changed(self, text: str):
         """Handle page size selection change"""
-        if text == "Custom":
-            if hasattr(self, 'custom_width'):
-                self.custom_width.show()
-            if hasattr(self, 'custom_height'):
-                self.custom_height.show()
-        else:
-            if hasattr(self, 'custom_width'):
-                self.custom_width.hide()
-            if hasattr(self, 'custom_height'):
-                self.custom_height.hide()
-            
-            # Set standard dimensions
-            if text == "A4" and hasattr(self, 'custom_width') and hasattr(self, 'custom_height'):
-                self.custom_width.setValue(8.27)
-                self.custom_height.setValue(11.69)
-            elif text == "Letter" and hasattr(self, 'custom_width') and hasattr(self, 'custom_height'):
-                self.custom_width.setValue(8.5)
-                self.custom_height.setValue(11.0)
-            elif text == "Legal" and hasattr(self, 'custom_width') and hasattr(self, 'custom_height'):
-                self.custom_width.setValue(8.5)
-                self.custom_height.setValue(14.0)
+        is_custom = text == "Custom"
+        self.custom_width.setVisible(is_custom)
+        self.custom_height.setVisible(is_custom)
+        
+        # Set standard dimensions
+        size = _PAGE_SIZES.get(text)
+        if size is not None:
+            width, height = size
+            self.custom_width.setValue(width)
+            self.custom_height.setValue(height)
                 
     def on_line_spacing_changed(self, text: str):
         """Handle line spacing selection change"""
-        if text == "Custom":
-            self.custom_line_spacing.show()
-        else:
-            self.custom_line_spacing.hide()
-            
-            # Set standard values
-            if "Single" in text:
-                self.custom_line_spacing.setValue(1.0)
-            elif "1.15" in text:
-                self.custom_line_spacing.setValue(1.15)
-            elif "1.5" in text:
-                self.custom_line_spacing.setValue(1.5)
-            elif "Double" in text:
-                self.custom_line_spacing.setValue(2.0)
+        self.custom_line_spacing.setVisible(text == "Custom")
+        
+        # Set standard values
+        value = _LINE_SPACING_MAP.get(text)
+        if value is not None:
+            self.custom_line_spacing.setValue(value)
                 
     def apply_settings(self):
         """Apply the current settings"""
@@ -383,56 +569,40 @@ class ModificationForm(QWidget):
             settings = self.collect_settings()
             self.settings_applied.emit(settings)
         except Exception as e:
-            self.logger.error(f"Error collecting settings: {e}")
+            self.logger.error("Error collecting settings: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to collect settings: {e}")
             
     def collect_settings(self) -> Dict[str, Any]:
         """Collect all settings from the form"""
-        settings = {}
+        # Read each widget once
+        page_size_text = self.page_size_combo.currentText()
+        line_spacing_text = self.line_spacing_combo.currentText()
+        font_family = self.font_family_combo.current_family()
+        font_size = self.font_size.value()
+        margins = {side: spinbox.value() for side, spinbox in self.margin_spinboxes.items()}
         
         # Page size settings
-        page_size_text = self.page_size_combo.currentText()
         if page_size_text == "Custom":
-            settings['page_size'] = {
-                'width': self.custom_width.value(),
-                'height': self.custom_height.value()
-            }
+            page_size = (self.custom_width.value(), self.custom_height.value())
         else:
-            # Use standard dimensions
-            if page_size_text == "A4":
-                settings['page_size'] = {'width': 8.27, 'height': 11.69}
-            elif page_size_text == "Letter":
-                settings['page_size'] = {'width': 8.5, 'height': 11.0}
-            elif page_size_text == "Legal":
-                settings['page_size'] = {'width': 8.5, 'height': 14.0}
-                
-        # Margin settings
-        settings['margins'] = {
-            'top': self.margin_top.value(),
-            'bottom': self.margin_bottom.value(),
-            'left': self.margin_left.value(),
-            'right': self.margin_right.value()
-        }
-        
-        # Font settings
-        settings['font_settings'] = {
-            'family': self.font_family_combo.currentText(),
-            'size': self.font_size.value()
-        }
-        
+            page_size = _PAGE_SIZES.get(page_size_text)
+            
         # Line spacing settings
-        line_spacing_text = self.line_spacing_combo.currentText()
         if line_spacing_text == "Custom":
-            settings['line_spacing'] = self.custom_line_spacing.value()
+            line_spacing = self.custom_line_spacing.value()
         else:
-            # Extract numeric value
-            if "Single" in line_spacing_text:
-                settings['line_spacing'] = 1.0
-            elif "1.15" in line_spacing_text:
-                settings['line_spacing'] = 1.15
-            elif "1.5" in line_spacing_text:
-                settings['line_spacing'] = 1.5
-            elif "Double" in line_spacing_text:
-                settings['line_spacing'] = 2.0
+            line_spacing = _LINE_SPACING_MAP.get(line_spacing_text)
+            
+        settings = {
+            'page_size': None if page_size is None else {'width': page_size[0], 'height': page_size[1]},
+            'margins': margins,
+            'font_settings': {'family': font_family, 'size': font_size},
+            'line_spacing': line_spacing
+        }
+        
+        # Leave out settings the form has no value for
+        for key in ('page_size', 'line_spacing'):
+            if settings[key] is None:
+                del settings[key]
                 
         return settings
@@ -2,18 +2,19 @@
 Centralized PyQt6 stylesheet definitions
 """
 
-def get_light_theme() -> str:
-    """Get light theme stylesheet"""
-    return """
+from PyQt6.QtCore import QObject
+
+# Shared stylesheet for both themes; colors are filled in from a palette
+_BASE_QSS_TEMPLATE = """
     QMainWindow {
-        background-color: #ffffff;
-        color: #212121;
+        background-color: %(window_bg)s;
+        color: %(text)s;
     }
     
     QWidget {
         font-family: system-ui, -apple-system, sans-serif;
         font-size: 12px;
-        color: #212121;
+        color: %(text)s;
     }
     
     QPushButton {
@@ -35,45 +36,45 @@ def get_light_theme() -> str:
     }
     
     QPushButton:disabled {
-        background-color: #bdbdbd;
+        background-color: %(disabled_bg)s;
         color: #757575;
     }
     
     QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {
-        border: 2px solid #e0e0e0;
+        border: 2px solid %(border)s;
         border-radius: 6px;
         padding: 8px 12px;
-        background-color: #ffffff;
-        color: #212121;
+        background-color: %(input_bg)s;
+        color: %(text)s;
         font-size: 12px;
     }
     
     QLineEdit:focus, QComboBox:focus, QSpinBox:focus, QDoubleSpinBox:focus {
         border-color: #1976d2;
-        background-color: #f8f9ff;
+        background-color: %(focus_bg)s;
     }
     
     QLabel {
-        color: #424242;
+        color: %(label)s;
         font-weight: 500;
     }
     
     QGroupBox {
         font-weight: 700;
         font-size: 13px;
-        color: #1976d2;
-        border: 2px solid #e0e0e0;
+        color: %(accent)s;
+        border: 2px solid %(border)s;
         border-radius: 8px;
         margin-top: 12px;
         padding-top: 12px;
-        background-color: #fafafa;
+        background-color: %(group_bg)s;
     }
     
     QGroupBox::title {
         subcontrol-origin: margin;
         left: 12px;
         padding: 0 8px 0 8px;
-        background-color: #fafafa;
+        background-color: %(group_bg)s;
     }
     
     QScrollArea {
@@ -82,11 +83,11 @@ def get_light_theme() -> str:
     }
     
     QProgressBar {
-        border: 2px solid #e0e0e0;
+        border: 2px solid %(border)s;
         border-radius: 6px;
         text-align: center;
-        background-color: #f5f5f5;
-        color: #212121;
+        background-color: %(progress_bg)s;
+        color: %(text)s;
     }
     
     QProgressBar::chunk {
@@ -96,137 +97,64 @@ def get_light_theme() -> str:
     
     /* Document overview specific styles */
     QLabel#documentInfo {
-        color: #1976d2;
+        color: %(accent)s;
         font-weight: 600;
         font-size: 13px;
     }
     
     QLabel#documentValue {
-        color: #424242;
+        color: %(label)s;
         font-weight: 500;
     }
     
-    QLabel#measurementUnit {
-        color: #757575;
-        font-style: italic;
-        font-size: 11px;
-    }
-    """
-
-def get_dark_theme() -> str:
-    """Get dark theme stylesheet"""
-    return """
-    QMainWindow {
-        background-color: #1a1a1a;
-        color: #ffffff;
-    }
-    
-    QWidget {
-        font-family: system-ui, -apple-system, sans-serif;
-        font-size: 12px;
-        color: #ffffff;
-    }
-    
-    QPushButton {
-        background-color: #1976d2;
-        color: white;
-        border: none;
-        padding: 10px 20px;
-        border-radius: 6px;
-        font-weight: 600;
-        font-size: 13px;
-    }
-    
-    QPushButton:hover {
-        background-color: #1565c0;
-    }
-    
-    QPushButton:pressed {
-        background-color: #0d47a1;
-    }
-    
-    QPushButton:disabled {
-        background-color: #424242;
-        color: #757575;
-    }
-    
-    QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {
-        border: 2px solid #424242;
-        border-radius: 6px;
-        padding: 8px 12px;
-        background-color: #2d2d2d;
-        color: #ffffff;
-        font-size: 12px;
-    }
-    
-    QLineEdit:focus, QComboBox:focus, QSpinBox:focus, QDoubleSpinBox:focus {
-        border-color: #1976d2;
-        background-color: #1a1f2e;
-    }
-    
-    QLabel {
-        color: #e0e0e0;
-        font-weight: 500;
-    }
-    
-    QGroupBox {
-        font-weight: 700;
-        font-size: 13px;
-        color: #64b5f6;
-        border: 2px solid #424242;
-        border-radius: 8px;
-        margin-top: 12px;
-        padding-top: 12px;
-        background-color: #2d2d2d;
-    }
-    
-    QGroupBox::title {
-        subcontrol-origin: margin;
-        left: 12px;
-        padding: 0 8px 0 8px;
-        background-color: #2d2d2d;
-    }
-    
-    QScrollArea {
-        border: none;
-        background-color: transparent;
-    }
-    
-    QProgressBar {
-        border: 2px solid #424242;
-        border-radius: 6px;
-        text-align: center;
-        background-color: #2d2d2d;
-        color: #ffffff;
-    }
-    
-    QProgressBar::chunk {
-        background-color: #1976d2;
-        border-radius: 4px;
-    }
-    
-    /* Document overview specific styles */
-    QLabel#documentInfo {
-        color: #64b5f6;
-        font-weight: 600;
-        font-size: 13px;
-    }
-    
-    QLabel#documentValue {
-        color: #e0e0e0;
-        font-weight: 500;
+    QLabel#documentKey {
+        color: %(label)s;
+        font-weight: bold;
     }
     
     QLabel#measurementUnit {
-        color: #bdbdbd;
+        color: %(muted)s;
         font-style: italic;
         font-size: 11px;
     }
     """
 
-def get_drag_drop_styles() -> str:
-    """Get drag and drop specific styles"""
-    return """
+# Light theme colors
+_LIGHT_PALETTE = {
+    "window_bg": "#ffffff",
+    "text": "#212121",
+    "label": "#424242",
+    "accent": "#1976d2",
+    "muted": "#757575",
+    "border": "#e0e0e0",
+    "input_bg": "#ffffff",
+    "focus_bg": "#f8f9ff",
+    "disabled_bg": "#bdbdbd",
+    "group_bg": "#fafafa",
+    "progress_bg": "#f5f5f5"
+}
+
+# Dark theme colors
+_DARK_PALETTE = {
+    "window_bg": "#1a1a1a",
+    "text": "#ffffff",
+    "label": "#e0e0e0",
+    "accent": "#64b5f6",
+    "muted": "#bdbdbd",
+    "border": "#424242",
+    "input_bg": "#2d2d2d",
+    "focus_bg": "#1a1f2e",
+    "disabled_bg": "#424242",
+    "group_bg": "#2d2d2d",
+    "progress_bg": "#2d2d2d"
+}
+
+# Stylesheets are built once at import; the getters hand out the shared strings
+_LIGHT_THEME_QSS = _BASE_QSS_TEMPLATE % _LIGHT_PALETTE
+_DARK_THEME_QSS = _BASE_QSS_TEMPLATE % _DARK_PALETTE
+
+# Drag and drop specific styles
+_DRAG_DROP_QSS = """
     QWidget#dragDropArea {
         border: 2px dashed #1976d2;
         border-radius: 8px;
@@ -238,9 +166,10 @@ def get_drag_drop_styles() -> str:
         border-color: #1565c0;
     }
     
-    QWidget#dragDropArea[dropActive="true"] {
-        background-color: rgba(25, 118, 210, 0.3);
-        border-color: #0d47a1;
+    QWidget#dragDropOverlay {
+        border: 2px dashed #0d47a1;
+        border-radius: 8px;
+        background-color: rgba(25, 118, 210, 0.2);
     }
     
     QLabel#dragDropLabel {
@@ -254,3 +183,29 @@ def get_drag_drop_styles() -> str:
         font-size: 11px;
     }
     """
+
+def get_light_theme() -> str:
+    """Get light theme stylesheet"""
+    return _LIGHT_THEME_QSS
+
+def get_dark_theme() -> str:
+    """Get dark theme stylesheet"""
+    return _DARK_THEME_QSS
+
+def get_drag_drop_styles() -> str:
+    """Get drag and drop specific styles"""
+    return _DRAG_DROP_QSS
+
+# Full window stylesheets, assembled once per theme
+_THEME_STYLESHEETS = {
+    "light": _LIGHT_THEME_QSS + _DRAG_DROP_QSS,
+    "dark": _DARK_THEME_QSS + _DRAG_DROP_QSS
+}
+
+def apply_theme(target: QObject, name: str) -> bool:
+    """Apply a theme stylesheet to an application or widget unless it is already active"""
+    if target.property("_current_theme") == name:
+        return False
+    target.setStyleSheet(_THEME_STYLESHEETS[name])
+    target.setProperty("_current_theme", name)
+    return True
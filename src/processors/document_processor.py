@@ -2,14 +2,100 @@
 Main document processor that handles both DOCX and RTF files
 """
 
+import copy
+import hashlib
+import json
 import logging
+import multiprocessing
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, List
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
 from .docx_processor import DocxProcessor
 from .rtf_processor import RtfProcessor
 from ..utils.file_validator import validate_file
 
+# Parsed statistics persisted across runs, one JSON file per document version
+_PARSE_CACHE_DIR = Path.home() / ".cache" / "WPDAdjuster" / "documents"
+
+# Bump when the parsers change what they report, so entries from older code are ignored
+_PARSE_CACHE_VERSION = 2
+
+# Most entries kept on disk; the least recently written are removed beyond this
+_PARSE_CACHE_MAX_ENTRIES = 256
+
+# Bytes hashed from the start of a file to tell apart versions with equal mtime and size
+_PARSE_CACHE_HEAD_BYTES = 64 * 1024
+
+@dataclass
+class BatchResults:
+    """Column-oriented statistics for a batch of processed documents"""
+    file_paths: List[str] = field(default_factory=list)
+    file_types: List[str] = field(default_factory=list)
+    word_counts: array = field(default_factory=lambda: array('q'))
+    paragraph_counts: array = field(default_factory=lambda: array('q'))
+    page_counts: array = field(default_factory=lambda: array('q'))
+    table_counts: array = field(default_factory=lambda: array('q'))
+    page_widths: array = field(default_factory=lambda: array('d'))
+    page_heights: array = field(default_factory=lambda: array('d'))
+    margins_top: array = field(default_factory=lambda: array('d'))
+    margins_bottom: array = field(default_factory=lambda: array('d'))
+    margins_left: array = field(default_factory=lambda: array('d'))
+    margins_right: array = field(default_factory=lambda: array('d'))
+    fonts_used: Counter = field(default_factory=Counter)
+    
+    def __len__(self) -> int:
+        """Number of documents in the batch"""
+        return len(self.file_paths)
+        
+    def append(self, document_data: Dict[str, Any]):
+        """Add one document's statistics to the columns"""
+        dimensions = document_data.get('page_dimensions') or {}
+        margins = document_data.get('margins') or {}
+        
+        self.file_paths.append(document_data['file_path'])
+        self.file_types.append(document_data.get('file_type', ''))
+        self.word_counts.append(document_data.get('word_count', 0))
+        self.paragraph_counts.append(document_data.get('paragraph_count', 0))
+        self.page_counts.append(document_data.get('page_count', 0))
+        self.table_counts.append(document_data.get('table_count', 0))
+        self.page_widths.append(dimensions.get('width', 0.0))
+        self.page_heights.append(dimensions.get('height', 0.0))
+        self.margins_top.append(margins.get('top', 0.0))
+        self.margins_bottom.append(margins.get('bottom', 0.0))
+        self.margins_left.append(margins.get('left', 0.0))
+        self.margins_right.append(margins.get('right', 0.0))
+        self.fonts_used.update(document_data.get('fonts_used') or {})
+
+class ProcessTaskSignals(QObject):
+    """Signals reporting the outcome of a background processing task"""
+    finished = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+class ProcessTask(QRunnable):
+    """Thread pool task that validates and processes a single document"""
+    
+    def __init__(self, processor: "DocumentProcessor", file_path: Path):
+        super().__init__()
+        self.processor = processor
+        self.file_path = file_path
+        self.signals = ProcessTaskSignals()
+        
+    def run(self):
+        """Run validation and processing on a pool thread"""
+        try:
+            document_data = self.processor.process_document(self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(document_data)
+
 class DocumentProcessor:
     """Main document processor that delegates to specific processors"""
     
@@ -17,6 +103,20 @@ class DocumentProcessor:
         self.logger = logging.getLogger(__name__)
         self.docx_processor = DocxProcessor()
         self.rtf_processor = RtfProcessor()
+        self._pending_tasks = set()
+        
+        # Processor for each supported file extension
+        self._processors = {
+            '.docx': self.docx_processor,
+            '.rtf': self.rtf_processor
+        }
+        
+    def _get_processor(self, file_path: Path):
+        """Return the processor for a file based on its extension"""
+        processor = self._processors.get(file_path.suffix.lower())
+        if processor is None:
+            raise ValueError(f"Unsupported file type: {file_path.suffix}")
+        return processor
         
     def process_document(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -33,15 +133,61 @@ class DocumentProcessor:
         if not is_valid:
             raise ValueError(f"Invalid file: {error_msg}")
             
-        self.logger.info(f"Processing document: {file_path}")
+        self.logger.info("Processing document: %s", file_path)
         
         # Determine processor based on file extension
-        if file_path.suffix.lower() == '.docx':
-            return self.docx_processor.process_document(file_path)
-        elif file_path.suffix.lower() == '.rtf':
-            return self.rtf_processor.process_document(file_path)
-        else:
-            raise ValueError(f"Unsupported file type: {file_path.suffix}")
+        processor = self._get_processor(file_path)
+        
+        # Statistics are cached per file version; hand out a copy the caller may modify
+        stat = file_path.stat()
+        document_data = copy.deepcopy(_parse_stats(processor, str(file_path), stat.st_mtime_ns, stat.st_size))
+        
+        # Keep the Path so apply_modifications does not have to re-parse the string
+        document_data['_path'] = file_path
+        return document_data
+            
+    def process_document_async(self, file_path: Path, on_done: Callable[[Dict[str, Any]], None],
+                               on_error: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Validate and process a document on the global thread pool
+        
+        Args:
+            file_path: Path to the document file
+            on_done: Called with the document data once processing succeeds
+            on_error: Called with the error message if validation or processing fails
+        """
+        task = ProcessTask(self, file_path)
+        
+        # Callbacks are delivered on the calling thread; keep the signals alive until then
+        signals = task.signals
+        self._pending_tasks.add(signals)
+        signals.finished.connect(on_done)
+        if on_error is not None:
+            signals.failed.connect(on_error)
+        signals.finished.connect(lambda _: self._pending_tasks.discard(signals))
+        signals.failed.connect(lambda _: self._pending_tasks.discard(signals))
+        
+        QThreadPool.globalInstance().start(task)
+        
+    def process_batch(self, paths: List[Path], max_workers: Optional[int] = None) -> BatchResults:
+        """
+        Process several documents in parallel worker processes
+        
+        Args:
+            paths: Paths to the document files
+            max_workers: Maximum number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            Column-oriented statistics, one row per path in input order
+        """
+        results = BatchResults()
+        
+        # Spawn fresh workers; forking would copy a process that runs Qt and logging threads
+        spawn_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=spawn_context) as executor:
+            for document_data in executor.map(_process_one, paths):
+                results.append(document_data)
+        return results
             
     def apply_modifications(self, document_data: Dict[str, Any], settings: Dict[str, Any]) -> Path:
         """
@@ -54,18 +200,76 @@ class DocumentProcessor:
         Returns:
             Path to the modified document
         """
-        file_path = Path(document_data['file_path'])
+        file_path = document_data.get('_path') or Path(document_data['file_path'])
         
-        self.logger.info(f"Applying modifications to: {file_path}")
+        self.logger.info("Applying modifications to: %s", file_path)
         
         # Determine processor based on file extension
-        if file_path.suffix.lower() == '.docx':
-            return self.docx_processor.apply_modifications(document_data, settings)
-        elif file_path.suffix.lower() == '.rtf':
-            return self.rtf_processor.apply_modifications(document_data, settings)
-        else:
-            raise ValueError(f"Unsupported file type: {file_path.suffix}")
+        return self._get_processor(file_path).apply_modifications(document_data, settings)
             
     def get_supported_extensions(self) -> list:
         """Get list of supported file extensions"""
-        return ['.docx', '.rtf']
+        return list(self._processors)
+
+def _process_one(file_path: Path) -> Dict[str, Any]:
+    """Process a single document in a worker process"""
+    return DocumentProcessor().process_document(file_path)
+
+@lru_cache(maxsize=128)
+def _parse_stats(processor, path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a document version once per process, reusing the disk cache when it matches"""
+    file_path = Path(path)
+    cache_key = f"{_PARSE_CACHE_VERSION}:{path}:{mtime_ns}:{size}"
+    cache_file = _PARSE_CACHE_DIR / (hashlib.sha1(cache_key.encode()).hexdigest() + ".json")
+    head_digest = _head_digest(file_path)
+    document_data = _load_cached_stats(cache_file, head_digest)
+    if document_data is None:
+        document_data = processor.process_document(file_path)
+        _save_cached_stats(cache_file, head_digest, document_data)
+    return document_data
+
+def _head_digest(file_path: Path) -> str:
+    """Hash the first bytes of a file"""
+    with open(file_path, "rb") as document_file:
+        return hashlib.sha1(document_file.read(_PARSE_CACHE_HEAD_BYTES)).hexdigest()
+
+def _load_cached_stats(cache_file: Path, head_digest: str) -> Optional[Dict[str, Any]]:
+    """Return the cached statistics if the cache entry matches the format version and file head"""
+    try:
+        with open(cache_file, encoding="utf-8") as cache:
+            entry = json.load(cache)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("version") != _PARSE_CACHE_VERSION:
+        return None
+    if entry.get("head") != head_digest:
+        return None
+    document_data = entry.get("stats")
+    return document_data if isinstance(document_data, dict) else None
+
+def _save_cached_stats(cache_file: Path, head_digest: str, document_data: Dict[str, Any]) -> None:
+    """Write the statistics and the file head digest to the disk cache"""
+    try:
+        _PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as cache:
+            json.dump({"version": _PARSE_CACHE_VERSION, "head": head_digest, "stats": document_data}, cache)
+    except (OSError, TypeError, ValueError) as e:
+        logging.getLogger(__name__).warning("Could not write document cache %s: %s", cache_file, e)
+        return
+    _prune_cached_stats()
+
+def _prune_cached_stats() -> None:
+    """Remove the oldest disk cache entries beyond the entry limit"""
+    try:
+        entries = [(entry.stat().st_mtime_ns, entry) for entry in _PARSE_CACHE_DIR.glob("*.json")]
+    except OSError:
+        return
+    if len(entries) <= _PARSE_CACHE_MAX_ENTRIES:
+        return
+        
+    entries.sort(key=itemgetter(0))
+    for _, entry in entries[:len(entries) - _PARSE_CACHE_MAX_ENTRIES]:
+        try:
+            entry.unlink()
+        except OSError:
+            pass
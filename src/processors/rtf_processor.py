@@ -3,12 +3,36 @@ RTF document processor using striprtf
 """
 
 import logging
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from striprtf.striprtf import rtf_to_text
 import tempfile
 import re
 
+# RTF is 7-bit ASCII with \\'xx escapes for other characters, so latin-1 maps
+# every byte to one character without validation and round-trips the file exactly
+_RTF_ENCODING = 'latin-1'
+
+# RTF patterns, compiled once at import
+_RE_FONTTBL = re.compile(rb'\\fonttbl\s*\{([^}]+)\}')
+_RE_FONT_ENTRY = re.compile(rb'\\f(\d+)\s*([^;]+);')
+
+# Control words the analysis needs, matched in one pass over the raw bytes:
+# \title / \author values and the id of each \fN font switch
+_RE_RTF_SCAN = re.compile(
+    rb'\\(?:(title|author)\s*([^\\}]+)|f(\d+))',
+    re.IGNORECASE
+)
+
+# Margin control words in the order they end up after the \rtf1 header
+_MARGIN_KEYWORDS = (
+    ('bottom', '\\margb'),
+    ('top', '\\margt'),
+    ('right', '\\margr'),
+    ('left', '\\margl')
+)
+
 class RtfProcessor:
     """Processor for RTF documents"""
     
@@ -26,16 +50,17 @@ class RtfProcessor:
             Dictionary containing document properties
         """
         try:
-            # Read RTF file content
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                rtf_content = f.read()
-                
+            # Read RTF file content; only the text handed to striprtf is decoded
+            raw = file_path.read_bytes()
+            rtf_content = raw.decode(_RTF_ENCODING)
+            
             # Convert RTF to plain text for analysis
             plain_text = rtf_to_text(rtf_content)
             
-            # Extract basic metadata
-            title = self._extract_rtf_property(rtf_content, 'title') or 'Untitled'
-            author = self._extract_rtf_property(rtf_content, 'author') or 'Unknown'
+            # Extract metadata, font usage and table count in a single scan
+            title, author, fonts_used, table_count = self._scan_rtf(raw)
+            title = title or 'Untitled'
+            author = author or 'Unknown'
             
             # Extract page settings (RTF doesn't have standard page size info)
             page_dimensions = {'width': 8.5, 'height': 11.0}  # Default to Letter
@@ -43,17 +68,10 @@ class RtfProcessor:
             # Extract margins (basic parsing)
             margins = self._extract_margins(rtf_content)
             
-            # Extract font information
-            fonts_used = self._extract_rtf_fonts(rtf_content)
-            
             # Count paragraphs and words from plain text
-            paragraphs = [p.strip() for p in plain_text.split('\n') if p.strip()]
-            paragraph_count = len(paragraphs)
+            paragraph_count = sum(1 for line in plain_text.split('\n') if line and not line.isspace())
             word_count = len(plain_text.split())
             
-            # Count tables (basic detection)
-            table_count = self._count_tables(rtf_content)
-            
             return {
                 'file_path': str(file_path),
                 'filename': file_path.name,
@@ -68,12 +86,11 @@ class RtfProcessor:
                 'fonts_used': fonts_used,
                 'heading_counts': {'Heading 1': 0, 'Heading 2': 0, 'Heading 3': 0, 
                                  'Heading 4': 0, 'Heading 5': 0, 'Heading 6': 0},
-                'table_count': table_count,
-                'rtf_content': rtf_content  # Keep content for modifications
+                'table_count': table_count
             }
             
         except Exception as e:
-            self.logger.error(f"Error processing RTF document: {e}")
+            self.logger.error("Error processing RTF document: %s", e)
             raise ValueError(f"Failed to process RTF document: {e}")
             
     def apply_modifications(self, document_data: Dict[str, Any], settings: Dict[str, Any]) -> Path:
@@ -88,7 +105,8 @@ class RtfProcessor:
             Path to modified document
         """
         try:
-            rtf_content = document_data['rtf_content']
+            # Re-read the original content; only its statistics are kept after processing
+            rtf_content = Path(document_data['file_path']).read_bytes().decode(_RTF_ENCODING)
             
             # For RTF, we'll be very conservative and only add minimal formatting
             # RTF files are complex and we want to preserve all existing formatting
@@ -105,38 +123,26 @@ class RtfProcessor:
             # Check margins
             if 'margins' in settings:
                 margins = settings['margins']
-                # Convert inches to twips (1 inch = 1440 twips)
-                if 'left' in margins and '\\margl' not in rtf_content:
-                    left_twips = int(margins['left'] * 1440)
-                    # Add left margin command
-                    modified_content = modified_content.replace('\\rtf1', f'\\rtf1\\margl{left_twips}')
-                    needs_modification = True
-                    
-                if 'right' in margins and '\\margr' not in rtf_content:
-                    right_twips = int(margins['right'] * 1440)
-                    modified_content = modified_content.replace('\\rtf1', f'\\rtf1\\margr{right_twips}')
-                    needs_modification = True
-                    
-                if 'top' in margins and '\\margt' not in rtf_content:
-                    top_twips = int(margins['top'] * 1440)
-                    modified_content = modified_content.replace('\\rtf1', f'\\rtf1\\margt{top_twips}')
-                    needs_modification = True
-                    
-                if 'bottom' in margins and '\\margb' not in rtf_content:
-                    bottom_twips = int(margins['bottom'] * 1440)
-                    modified_content = modified_content.replace('\\rtf1', f'\\rtf1\\margb{bottom_twips}')
+                # Convert inches to twips (1 inch = 1440 twips) and insert every
+                # missing margin keyword after the header in a single pass
+                extras = [
+                    f'{keyword}{int(margins[side] * 1440)}'
+                    for side, keyword in _MARGIN_KEYWORDS
+                    if side in margins and keyword not in rtf_content
+                ]
+                if extras:
+                    modified_content = modified_content.replace('\\rtf1', '\\rtf1' + ''.join(extras), 1)
                     needs_modification = True
             
             # Save modified document (even if no changes were made)
             output_path = self._get_output_path(document_data['file_path'])
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
+            output_path.write_bytes(modified_content.encode(_RTF_ENCODING))
             
-            self.logger.info(f"Modified RTF saved to: {output_path}")
+            self.logger.info("Modified RTF saved to: %s", output_path)
             return output_path
             
         except Exception as e:
-            self.logger.error(f"Error applying modifications to RTF: {e}")
+            self.logger.error("Error applying modifications to RTF: %s", e)
             raise ValueError(f"Failed to apply modifications: {e}")
             
     def _parse_rtf_content(self, content: str, doc):
@@ -144,11 +150,48 @@ class RtfProcessor:
         # striprtf handles the conversion, so this is just a placeholder
         pass
         
-    def _extract_rtf_property(self, content: str, property_name: str) -> str:
-        """Extract RTF document properties"""
-        pattern = r'\\' + property_name + r'\s*([^\\}]+)'
-        match = re.search(pattern, content, re.IGNORECASE)
-        return match.group(1).strip() if match else None
+    def _scan_rtf(self, raw: bytes) -> Tuple[Optional[str], Optional[str], Dict[str, int], int]:
+        """Extract title, author, font usage and table count from raw RTF bytes"""
+        # Look for font table; \fN switches after it count as uses of font N
+        name_by_id = {}
+        body_start = 0
+        font_table_match = _RE_FONTTBL.search(raw)
+        if font_table_match:
+            body_start = font_table_match.end()
+            for font_id, font_name in _RE_FONT_ENTRY.findall(font_table_match.group(1)):
+                name_by_id[int(font_id)] = font_name.strip().decode('utf-8', errors='ignore')
+                
+        properties = {}
+        counts_by_id = Counter()
+        
+        for match in _RE_RTF_SCAN.finditer(raw):
+            property_name, value, font_id = match.groups()
+            if font_id is not None:
+                if match.start() >= body_start:
+                    counts_by_id[int(font_id)] += 1
+            else:
+                # Keep the first occurrence of each property
+                properties.setdefault(property_name.lower(), value)
+                
+        title = self._decode_property(properties.get(b'title'))
+        author = self._decode_property(properties.get(b'author'))
+        
+        # Table rows are a literal keyword, counted by the C substring search
+        table_count = raw.count(b'\\trowd')
+        
+        # Translate the per-id tallies to font names, keeping unused fonts at zero
+        fonts = dict.fromkeys(name_by_id.values(), 0)
+        for font_id, count in counts_by_id.items():
+            if font_id in name_by_id:
+                fonts[name_by_id[font_id]] += count
+                
+        return title, author, fonts, table_count
+        
+    def _decode_property(self, value: Optional[bytes]) -> Optional[str]:
+        """Decode an RTF property value, treating empty values as missing"""
+        if value is None:
+            return None
+        return value.decode('utf-8', errors='ignore').strip() or None
         
     def _extract_margins(self, content: str) -> Dict[str, float]:
         """Extract margin information from RTF"""
@@ -160,37 +203,6 @@ class RtfProcessor:
             'right': 1.0
         }
         
-    def _extract_rtf_fonts(self, content: str) -> Dict[str, int]:
-        """Extract font usage from RTF content"""
-        fonts = {}
-        
-        # Look for font table
-        font_table_match = re.search(r'\\fonttbl\s*\{([^}]+)\}', content)
-        if font_table_match:
-            font_table = font_table_match.group(1)
-            font_matches = re.findall(r'\\f(\d+)\s*([^;]+);', font_table)
-            for font_id, font_name in font_matches:
-                fonts[font_name.strip()] = 0
-                
-        # Count font usage
-        for font_name in fonts.keys():
-            pattern = r'\\f\d+\s*[^\\]*' + re.escape(font_name)
-            fonts[font_name] = len(re.findall(pattern, content, re.IGNORECASE))
-            
-        return fonts
-        
-    def _count_words(self, content: str) -> int:
-        """Count words in RTF content"""
-        # Remove RTF control codes
-        clean_content = re.sub(r'\\[a-z]+\d*\s*', ' ', content)
-        clean_content = re.sub(r'[{}]', ' ', clean_content)
-        words = clean_content.split()
-        return len([w for w in words if w.strip()])
-        
-    def _count_tables(self, content: str) -> int:
-        """Count tables in RTF content"""
-        return len(re.findall(r'\\trowd', content))
-        
     # Removed problematic methods that were adding zeros to document text
     # New approach only adds formatting commands at document level
         
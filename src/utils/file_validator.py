@@ -3,15 +3,32 @@ File validation utilities
 """
 
 import mimetypes
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Iterable, List, Tuple, Optional
 
-SUPPORTED_EXTENSIONS = {'.docx', '.rtf'}
-SUPPORTED_MIME_TYPES = {
+# Load the MIME database once at import instead of on the first guess_type call
+mimetypes.init()
+
+SUPPORTED_EXTENSIONS = frozenset({'.docx', '.rtf'})
+SUPPORTED_MIME_TYPES = frozenset({
     'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
     'application/rtf',
     'text/rtf'
-}
+})
+
+@lru_cache(maxsize=64)
+def _check_suffix(suffix: str) -> Optional[str]:
+    """Return the validation error for a lowercased file suffix, or None if it is supported"""
+    if suffix not in SUPPORTED_EXTENSIONS:
+        return f"Unsupported file extension. Only {', '.join(SUPPORTED_EXTENSIONS)} are supported"
+    
+    # The MIME type only depends on the suffix, so it is looked up once per suffix
+    mime_type, _ = mimetypes.guess_type('file' + suffix)
+    if mime_type and mime_type not in SUPPORTED_MIME_TYPES:
+        return f"Unsupported file type: {mime_type}"
+    
+    return None
 
 def validate_file(file_path: Path) -> Tuple[bool, Optional[str]]:
     """
@@ -29,17 +46,26 @@ def validate_file(file_path: Path) -> Tuple[bool, Optional[str]]:
     if not file_path.is_file():
         return False, "Path is not a file"
     
-    # Check extension
-    if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
-        return False, f"Unsupported file extension. Only {', '.join(SUPPORTED_EXTENSIONS)} are supported"
-    
-    # Check MIME type
-    mime_type, _ = mimetypes.guess_type(str(file_path))
-    if mime_type and mime_type not in SUPPORTED_MIME_TYPES:
-        return False, f"Unsupported file type: {mime_type}"
+    # Check extension and MIME type
+    error = _check_suffix(file_path.suffix.lower())
+    if error:
+        return False, error
     
     return True, None
 
+def validate_files(paths: Iterable[Path]) -> List[Tuple[bool, Optional[str]]]:
+    """
+    Validate a batch of files
+    
+    Args:
+        paths: Paths to files to validate
+        
+    Returns:
+        One (is_valid, error_message) tuple per path, in input order
+    """
+    return [validate_file(Path(path)) for path in paths]
+
+@lru_cache(maxsize=256)
 def is_supported_extension(file_path: Path) -> bool:
     """Check if file has supported extension"""
     return file_path.suffix.lower() in SUPPORTED_EXTENSIONS
@@ -2,25 +2,45 @@
 Logging configuration
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
+from typing import Optional
+
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Background listener that writes queued records to the real handlers
+_listener: Optional[logging.handlers.QueueListener] = None
 
 def setup_logging():
     """Setup application logging configuration"""
+    global _listener
+    if _listener is not None:
+        return
+    
     # Create logs directory
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
     
+    formatter = logging.Formatter(_LOG_FORMAT)
+    file_handler = logging.FileHandler(log_dir / "wpdadjuster.log")
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    
+    # Callers only enqueue records; file and console I/O happen on the listener thread
+    log_queue = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+    
     # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_dir / "wpdadjuster.log"),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Set specific loggers
     logging.getLogger("PyQt6").setLevel(logging.WARNING)
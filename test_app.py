@@ -29,7 +29,7 @@ def test_settings():
     """Test settings configuration"""
     try:
         from config.settings import AppSettings
-        settings = AppSettings()
+        settings = AppSettings.from_env()
         print(f"✓ Settings initialized - Theme: {settings.theme}, Debug: {settings.debug}")
         return True
     except Exception as e:
@@ -75,6 +75,90 @@ def test_processors():
         print(f"✗ Processor error: {e}")
         return False
 
+# Minimal RTF sample: one font used twice, title / author metadata and one table row
+_SAMPLE_RTF = (
+    b'{\\rtf1\\ansi{\\fonttbl{\\f0 Arial;}}{\\info{\\title Sample}{\\author Tester}}'
+    b'\\f0 one two\\par \\f0 three\\par\\trowd\\cell\\row}'
+)
+
+def _write_sample_documents(directory: Path):
+    """Write a small DOCX and RTF sample document and return their paths"""
+    from docx import Document
+    
+    docx_path = directory / "sample.docx"
+    doc = Document()
+    doc.add_heading("Sample Title", level=1)
+    run = doc.add_paragraph().add_run("Hello brave new world")
+    run.font.name = "Arial"
+    doc.add_table(rows=1, cols=2)
+    doc.save(docx_path)
+    
+    rtf_path = directory / "sample.rtf"
+    rtf_path.write_bytes(_SAMPLE_RTF)
+    return docx_path, rtf_path
+
+def test_document_stats():
+    """Test DOCX and RTF statistics and the parse cache"""
+    try:
+        import tempfile
+        from src.processors.document_processor import DocumentProcessor
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            docx_path, rtf_path = _write_sample_documents(Path(tmp))
+            processor = DocumentProcessor()
+            
+            docx_data = processor.process_document(docx_path)
+            assert docx_data['word_count'] == 6
+            assert docx_data['paragraph_count'] == 2
+            assert docx_data['fonts_used'] == {'Arial': 1}
+            assert docx_data['heading_counts']['Heading 1'] == 1
+            assert docx_data['table_count'] == 1
+            
+            rtf_data = processor.process_document(rtf_path)
+            assert rtf_data['title'] == 'Sample'
+            assert rtf_data['author'] == 'Tester'
+            assert rtf_data['fonts_used'] == {'Arial': 2}  # one count per \f0 switch
+            assert rtf_data['paragraph_count'] == 3
+            assert rtf_data['table_count'] == 1
+            
+            # Cached results are handed out as independent copies
+            rtf_data['fonts_used']['Arial'] = 0
+            assert processor.process_document(rtf_path)['fonts_used'] == {'Arial': 2}
+        print("✓ Document statistics extracted correctly")
+        return True
+    except Exception as e:
+        print(f"✗ Document statistics error: {e!r}")
+        return False
+
+def test_batch_processing():
+    """Test batch validation and processing"""
+    try:
+        import tempfile
+        from src.processors.document_processor import DocumentProcessor
+        from src.utils.file_validator import validate_files
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            docx_path, rtf_path = _write_sample_documents(Path(tmp))
+            paths = [docx_path, rtf_path]
+            
+            assert validate_files(paths + [Path(tmp) / "missing.docx"]) == [
+                (True, None), (True, None), (False, "File does not exist")
+            ]
+            
+            processor = DocumentProcessor()
+            results = processor.process_batch(paths, max_workers=2)
+            assert len(results) == 2
+            assert results.file_paths == [str(path) for path in paths]
+            assert results.file_types == ['docx', 'rtf']
+            assert list(results.word_counts) == [processor.process_document(path)['word_count'] for path in paths]
+            assert list(results.table_counts) == [1, 1]
+            assert results.fonts_used == {'Arial': 3}
+        print("✓ Batch processing working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ Batch processing error: {e!r}")
+        return False
+
 def main():
     """Run all tests"""
     print("Testing WPDAdjuster components...")
@@ -84,7 +168,9 @@ def main():
         test_imports,
         test_settings,
         test_file_validator,
-        test_processors
+        test_processors,
+        test_document_stats,
+        test_batch_processing
     ]
     
     passed = 0